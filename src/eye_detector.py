@@ -1,17 +1,124 @@
 import cv2
 import numpy as np
-from collections import deque
-import time
 import mediapipe as mp
 from log import error
 
+try:
+    from numba import njit
+except ImportError:
+    # Fall back to plain Python functions when numba is not installed
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Integer codes for the eye and gaze state machines
+EYE_STATES = ("open", "closing", "closed", "opening")
+EYE_STATE_CODES = {state: code for code, state in enumerate(EYE_STATES)}
+EYE_OPEN, EYE_CLOSING, EYE_CLOSED, EYE_OPENING = range(4)
+
+GAZING_STATES = ("not_gazing", "gazing")
+GAZING_STATE_CODES = {state: code for code, state in enumerate(GAZING_STATES)}
+NOT_GAZING, GAZING = range(2)
+
+
+@njit(cache=True)
+def _eye_aspect_ratio(eye):
+    """EAR kernel over a (6, 2) array of points p1..p6"""
+    dx = eye[1, 0] - eye[5, 0]
+    dy = eye[1, 1] - eye[5, 1]
+    A = np.sqrt(dx * dx + dy * dy)
+    dx = eye[2, 0] - eye[4, 0]
+    dy = eye[2, 1] - eye[4, 1]
+    B = np.sqrt(dx * dx + dy * dy)
+    dx = eye[0, 0] - eye[3, 0]
+    dy = eye[0, 1] - eye[3, 1]
+    C = np.sqrt(dx * dx + dy * dy)
+    
+    if C == 0:
+        return 0.0
+    return (A + B) / (2.0 * C)
+
+
+# Eye state transition tables indexed by [state, triggered], where "triggered" is
+# EAR below the blink threshold for open/closing and above the open threshold for closed/opening
+_EYE_NEXT_STATE = np.array([
+    [EYE_OPEN, EYE_CLOSING],
+    [EYE_OPEN, EYE_CLOSING],
+    [EYE_CLOSED, EYE_OPENING],
+    [EYE_CLOSED, EYE_OPENING],
+], dtype=np.int8)
+# Counter updates: counter = counter * KEEP + ADD
+_BLINK_KEEP = np.array([[1, 0], [0, 1], [1, 0], [1, 1]], dtype=np.int8)
+_BLINK_ADD = np.array([[0, 1], [0, 1], [0, 0], [0, -1]], dtype=np.int8)
+_CLOSED_KEEP = np.array([[1, 0], [1, 1], [1, 1], [1, 1]], dtype=np.int8)
+_CLOSED_ADD = np.array([[0, 0], [0, 0], [1, 0], [0, 0]], dtype=np.int8)
+
+
+@njit(cache=True)
+def _update_eye_state(state, blink_counter, closed_counter, avg_ear,
+                      blink_threshold, open_threshold, blink_frame_threshold):
+    """Eye state machine transition, returns (state, blink_counter, closed_counter, in_blink_phase)"""
+    if state < EYE_CLOSED:
+        triggered = 1 if avg_ear < blink_threshold else 0
+    else:
+        triggered = 1 if avg_ear > open_threshold else 0
+    
+    next_state = _EYE_NEXT_STATE[state, triggered]
+    blink_counter = blink_counter * _BLINK_KEEP[state, triggered] + _BLINK_ADD[state, triggered]
+    closed_counter = closed_counter * _CLOSED_KEEP[state, triggered] + _CLOSED_ADD[state, triggered]
+    
+    # Counter gated transitions: a long enough closure, and the end of the opening phase
+    if next_state == EYE_CLOSING and state == EYE_CLOSING and blink_counter > blink_frame_threshold:
+        next_state = EYE_CLOSED
+        closed_counter = blink_counter
+    elif next_state == EYE_OPENING and state == EYE_OPENING and blink_counter <= 0:
+        next_state = EYE_OPEN
+        blink_counter = 0
+        closed_counter = 0
+    
+    # The blink phase spans every state except open
+    return int(next_state), int(blink_counter), int(closed_counter), next_state != EYE_OPEN
+
+
+@njit(cache=True)
+def _update_gazing_state(state, confirm_counter, break_counter, position_variance,
+                         stability_threshold, confirmation_frames, break_frames):
+    """Gaze state machine transition, returns (state, confirm_counter, break_counter)"""
+    is_stable = position_variance < stability_threshold
+    
+    if state == NOT_GAZING:
+        if is_stable:
+            confirm_counter += 1
+            break_counter = 0
+            
+            if confirm_counter >= confirmation_frames:
+                state = GAZING
+                confirm_counter = 0
+        else:
+            confirm_counter = 0
+            
+    elif state == GAZING:
+        if not is_stable:
+            break_counter += 1
+            confirm_counter = 0
+            
+            if break_counter >= break_frames:
+                state = NOT_GAZING
+                break_counter = 0
+        else:
+            break_counter = 0
+    
+    return state, confirm_counter, break_counter
+
+
 class MediaPipeEyeDetector:
     def __init__(self):
         # Initialize MediaPipe Face Mesh
         self.mp_face_mesh = mp.solutions.face_mesh
         self.face_mesh = self.mp_face_mesh.FaceMesh(
             max_num_faces=1,
-            refine_landmarks=True,
+            refine_landmarks=False,  # Iris landmarks (468-477) are not used
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5
         )        
@@ -23,6 +130,15 @@ class MediaPipeEyeDetector:
         # Nose key point indices (for head stability detection)
         self.NOSE_INDICES = [1, 4, 6, 168, 197, 195, 5]
         
+        # All tracked landmark indices, gathered into one preallocated array per frame
+        self._LANDMARK_INDICES = self.LEFT_EYE_INDICES + self.RIGHT_EYE_INDICES + self.NOSE_INDICES
+        self._points = np.empty((len(self._LANDMARK_INDICES), 2), dtype=np.float32)
+        self._left = self._points[0:6]  # Views into self._points
+        self._right = self._points[6:12]
+        self._nose = self._points[12:19]
+        self._frame_size = None  # (w, h) the pixel scale below was built for
+        self._wh_scale = None
+        
         # Configuration parameters
         self.GAZING_STABILITY_THRESHOLD = 35  # Gaze stability threshold
         self.GAZING_CONFIRMATION_FRAMES = 12  # Continuous frames required to confirm gaze (lower requirement)
@@ -34,12 +150,27 @@ class MediaPipeEyeDetector:
         # Blink detection parameters
         self.BLINK_FRAME_THRESHOLD = 4  # Blink duration threshold (in frames)
         
-        # Data cache
-        self.face_position_history = deque(maxlen=25)
-        self.left_ear_history = deque(maxlen=40)
-        self.right_ear_history = deque(maxlen=40)
-        self.eyes_state_history = deque(maxlen=30)
-        self.nose_position_history = deque(maxlen=25)
+        # Run full MediaPipe detection every N frames while eyes are open
+        self.DETECTION_INTERVAL = 2
+        
+        # Frame size fed to MediaPipe (landmarks are normalized, so they map back to the full frame)
+        self.PROCESS_SIZE = (320, 240)
+        
+        # Reusable scratch buffers for the downscaled BGR and RGB frames
+        process_w, process_h = self.PROCESS_SIZE
+        self._small_buf = np.empty((process_h, process_w, 3), dtype=np.uint8)
+        self._rgb_buf = np.empty((process_h, process_w, 3), dtype=np.uint8)
+        
+        # Position history length (in frames) used for head stability
+        self.POSITION_HISTORY_SIZE = 25
+        
+        # Position history ring buffers (eye center and nose center)
+        self._eye_buf = np.empty((self.POSITION_HISTORY_SIZE, 2), dtype=np.float32)
+        self._eye_idx = 0
+        self._eye_n = 0
+        self._nose_buf = np.empty((self.POSITION_HISTORY_SIZE, 2), dtype=np.float32)
+        self._nose_idx = 0
+        self._nose_n = 0
         
         # Eye state tracking
         self.eye_state = "open"
@@ -52,10 +183,15 @@ class MediaPipeEyeDetector:
         self.gazing_confirm_counter = 0
         self.gazing_break_counter = 0
         
-        # FPS calculation related
-        self.frame_count = 0
-        self.start_time = time.time()
+        # Capture FPS, reported by the capture thread
         self.fps = 0
+        
+        # Frame subsampling
+        self._skip_counter = 0
+        self._last_result = None  # Last full detection result with a face
+        
+        # Pre-rendered label sprites, rendered on first use: (text, font_face, font_scale, color, thickness) -> sprite
+        self._label_sprites = {}
         self._closed = False  # Track whether resources have been released
     
     
@@ -76,110 +212,66 @@ class MediaPipeEyeDetector:
             
     def calculate_ear(self, eye_landmarks):
         """Calculate Eye Aspect Ratio (EAR) using standard 6-point method"""
-        p1, p2, p3, p4, p5, p6 = eye_landmarks
-        
-        A = np.linalg.norm(p2 - p6)
-        B = np.linalg.norm(p3 - p5)
-        C = np.linalg.norm(p1 - p4)
-        
-        if C == 0:
-            return 0.0
-        
-        ear = (A + B) / (2.0 * C)
-        return ear
+        return float(_eye_aspect_ratio(eye_landmarks))
+    
+    def extract_points(self, landmarks):
+        """Fill the tracked landmark buffer with pixel coordinates"""
+        normalized = np.fromiter(
+            (v for idx in self._LANDMARK_INDICES for v in (landmarks[idx].x, landmarks[idx].y)),
+            dtype=np.float32,
+            count=self._points.size
+        ).reshape(self._points.shape)
+        np.multiply(normalized, self._wh_scale, out=self._points)
     
-    def calculate_position_variance(self, position_history):
+    def calculate_position_variance(self, position_buffer, count):
         """Calculate variance of position history"""
-        if len(position_history) < 5:
+        if count < 5:
             return 1000  # Return a large value to indicate instability
         
-        positions = [pos for pos, _ in position_history]
-        x_variance = np.var([p[0] for p in positions])
-        y_variance = np.var([p[1] for p in positions])
-        return x_variance + y_variance
+        return float(position_buffer[:count].var(axis=0).sum())
+    
+    def record_position(self, eye_center, nose_center):
+        """Add eye and nose centers to the position history, returns the position variance (None until 5 samples)"""
+        size = self.POSITION_HISTORY_SIZE
+        self._eye_buf[self._eye_idx] = eye_center
+        self._eye_idx = (self._eye_idx + 1) % size
+        self._eye_n = min(self._eye_n + 1, size)
+        self._nose_buf[self._nose_idx] = nose_center
+        self._nose_idx = (self._nose_idx + 1) % size
+        self._nose_n = min(self._nose_n + 1, size)
+        
+        if self._eye_n < 5 or self._nose_n < 5:
+            return None
+        eye_variance = self.calculate_position_variance(self._eye_buf, self._eye_n)
+        nose_variance = self.calculate_position_variance(self._nose_buf, self._nose_n)
+        return (eye_variance + nose_variance) / 2.0
     
     def update_eye_state(self, avg_ear):
         """Update eye state machine"""
-        # State transition logic
-        if self.eye_state == "open":
-            if avg_ear < self.EAR_BLINK_THRESHOLD:
-                self.eye_state = "closing"
-                self.blink_counter = 1
-                self.closed_counter = 0
-                self.in_blink_phase = True
-                
-        elif self.eye_state == "closing":
-            if avg_ear < self.EAR_BLINK_THRESHOLD:
-                self.blink_counter += 1
-                if self.blink_counter > self.BLINK_FRAME_THRESHOLD:
-                    self.eye_state = "closed"
-                    self.closed_counter = self.blink_counter
-            else:
-                self.eye_state = "open"
-                self.blink_counter = 0
-                self.in_blink_phase = False
-                
-        elif self.eye_state == "closed":
-            if avg_ear > self.EAR_OPEN_THRESHOLD:
-                self.eye_state = "opening"
-                self.blink_counter = 0
-            else:
-                self.closed_counter += 1
-                
-        elif self.eye_state == "opening":
-            if avg_ear > self.EAR_OPEN_THRESHOLD:
-                self.blink_counter -= 1
-                if self.blink_counter <= 0:
-                    self.eye_state = "open"
-                    self.blink_counter = 0
-                    self.closed_counter = 0
-                    self.in_blink_phase = False
-            else:
-                self.eye_state = "closed"
-                
+        state, self.blink_counter, self.closed_counter, self.in_blink_phase = _update_eye_state(
+            EYE_STATE_CODES[self.eye_state], self.blink_counter, self.closed_counter,
+            avg_ear, self.EAR_BLINK_THRESHOLD, self.EAR_OPEN_THRESHOLD, self.BLINK_FRAME_THRESHOLD
+        )
+        self.eye_state = EYE_STATES[state]
         return self.eye_state
     
     def update_gazing_state(self, position_variance):
         """Update gaze state machine based on position variance"""
-        is_stable = position_variance < self.GAZING_STABILITY_THRESHOLD
-        
-        if self.gazing_state == "not_gazing":
-            if is_stable:
-                self.gazing_confirm_counter += 1
-                self.gazing_break_counter = 0
-                
-                if self.gazing_confirm_counter >= self.GAZING_CONFIRMATION_FRAMES:
-                    self.gazing_state = "gazing"
-                    self.gazing_confirm_counter = 0
-            else:
-                self.gazing_confirm_counter = 0
-                self.gazing_state = "not_gazing"
-                
-        elif self.gazing_state == "gazing":
-            if not is_stable:
-                self.gazing_break_counter += 1
-                self.gazing_confirm_counter = 0
-                
-                if self.gazing_break_counter >= self.GAZING_BREAK_FRAMES:
-                    self.gazing_state = "not_gazing"
-                    self.gazing_break_counter = 0
-            else:
-                self.gazing_break_counter = 0
-                self.gazing_state = "gazing"
-        
+        state, self.gazing_confirm_counter, self.gazing_break_counter = _update_gazing_state(
+            GAZING_STATE_CODES[self.gazing_state], self.gazing_confirm_counter,
+            self.gazing_break_counter, position_variance, self.GAZING_STABILITY_THRESHOLD,
+            self.GAZING_CONFIRMATION_FRAMES, self.GAZING_BREAK_FRAMES
+        )
+        self.gazing_state = GAZING_STATES[state]
         return self.gazing_state
     
     def detect_eyes_state(self, frame):
         """Detect eye state using MediaPipe"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Calculate FPS
-        self.frame_count += 1
-        if self.frame_count % 10 == 0:
-            elapsed_time = time.time() - self.start_time
-            self.fps = self.frame_count / elapsed_time if elapsed_time > 0 else 0
-            self.start_time = time.time()
-            self.frame_count = 0
+        # Skip inference on interleaved frames while eyes are open. The decision uses the last processed
+        # frame's state, so a blink onset landing on a skipped frame is detected one frame late
+        self._skip_counter = (self._skip_counter + 1) % self.DETECTION_INTERVAL
+        if self._skip_counter and self._last_result is not None and self.eye_state == "open":
+            return self.reuse_last_result()
         
         detection_result = {
             'face_detected': False,
@@ -198,8 +290,11 @@ class MediaPipeEyeDetector:
         }
         
         # Process frame
+        self._last_result = None
+        cv2.resize(frame, self.PROCESS_SIZE, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small_buf, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         try:
-            results = self.face_mesh.process(rgb_frame)
+            results = self.face_mesh.process(self._rgb_buf)
         except Exception as e:
             error(f"Error processing frame with MediaPipe: {e}")
             return detection_result
@@ -225,27 +320,13 @@ class MediaPipeEyeDetector:
         
         # Extract eye landmark coordinates
         h, w = frame.shape[:2]
-        left_eye_points = []
-        right_eye_points = []
-        nose_points = []
-        
-        # Left eye landmarks
-        for idx in self.LEFT_EYE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            x, y = int(landmark.x * w), int(landmark.y * h)
-            left_eye_points.append(np.array([x, y]))
-        
-        # Right eye landmarks
-        for idx in self.RIGHT_EYE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            x, y = int(landmark.x * w), int(landmark.y * h)
-            right_eye_points.append(np.array([x, y]))
-        
-        # Nose landmarks
-        for idx in self.NOSE_INDICES:
-            landmark = face_landmarks.landmark[idx]
-            x, y = int(landmark.x * w), int(landmark.y * h)
-            nose_points.append(np.array([x, y]))
+        if self._frame_size != (w, h):
+            self._frame_size = (w, h)
+            self._wh_scale = np.array([w, h], dtype=np.float32)
+        self.extract_points(face_landmarks.landmark)
+        left_eye_points = self._left
+        right_eye_points = self._right
+        nose_points = self._nose
         
         # Calculate Eye Aspect Ratio
         left_ear = self.calculate_ear(left_eye_points)
@@ -256,10 +337,6 @@ class MediaPipeEyeDetector:
         detection_result['right_ear'] = right_ear
         detection_result['avg_ear'] = avg_ear
         
-        # Record historical EAR values
-        self.left_ear_history.append(left_ear)
-        self.right_ear_history.append(right_ear)
-        
         # Update eye state machine
         eye_state = self.update_eye_state(avg_ear)
         detection_result['eye_state'] = eye_state
@@ -292,28 +369,18 @@ class MediaPipeEyeDetector:
         detection_result['is_blinking'] = is_blinking
         detection_result['is_short_blink'] = is_short_blink
         
-        # Record eye state history
-        self.eyes_state_history.append(eye_state)
-        
         # Calculate eye center position
-        left_eye_center = np.mean(left_eye_points, axis=0)
-        right_eye_center = np.mean(right_eye_points, axis=0)
-        eye_center = ((left_eye_center + right_eye_center) / 2).astype(int)
-        detection_result['eye_center'] = (int(eye_center[0]), int(eye_center[1]))
+        eye_sum = left_eye_points.sum(0) + right_eye_points.sum(0)
+        eye_center = (int(eye_sum[0] * (1.0 / 12.0)), int(eye_sum[1] * (1.0 / 12.0)))
+        detection_result['eye_center'] = eye_center
         
         # Calculate nose center position
-        nose_center = np.mean(nose_points, axis=0).astype(int)
-        
-        # Record position history
-        current_time = time.time()
-        self.face_position_history.append((tuple(eye_center), current_time))
-        self.nose_position_history.append((tuple(nose_center), current_time))
-        
-        # Calculate position variance
-        if len(self.face_position_history) >= 5 and len(self.nose_position_history) >= 5:
-            eye_variance = self.calculate_position_variance(self.face_position_history)
-            nose_variance = self.calculate_position_variance(self.nose_position_history)
-            position_variance = (eye_variance + nose_variance) / 2.0
+        nose_sum = nose_points.sum(0)
+        nose_center = (int(nose_sum[0] * (1.0 / 7.0)), int(nose_sum[1] * (1.0 / 7.0)))
+        
+        # Record position history and calculate position variance
+        position_variance = self.record_position(eye_center, nose_center)
+        if position_variance is not None:
             detection_result['position_variance'] = position_variance
             
             # Update gaze state (simplified version, does not consider blinking)
@@ -324,8 +391,58 @@ class MediaPipeEyeDetector:
             detection_result['is_gazing'] = False
             detection_result['gazing_state'] = "not_gazing"
         
+        self._last_result = detection_result
         return detection_result
     
+    def reuse_last_result(self):
+        """Reuse the last detection result on a skipped frame"""
+        detection_result = dict(self._last_result)
+        detection_result['fps'] = self.fps
+        
+        # Hold the last position for the skipped frame, so the history still spans POSITION_HISTORY_SIZE
+        # frames and the frame based gaze counters advance on a variance over the same time window
+        size = self.POSITION_HISTORY_SIZE
+        position_variance = self.record_position(self._eye_buf[(self._eye_idx - 1) % size],
+                                                 self._nose_buf[(self._nose_idx - 1) % size])
+        if position_variance is not None:
+            detection_result['position_variance'] = position_variance
+            gazing_state = self.update_gazing_state(position_variance)
+            detection_result['gazing_state'] = gazing_state
+            detection_result['is_gazing'] = (gazing_state == "gazing")
+        
+        self._last_result = detection_result
+        return detection_result
+    
+    def render_label(self, text, font_face, font_scale, color, thickness):
+        """Render a text label once into a (sprite, mask, offset_x, offset_y) tuple"""
+        (text_w, text_h), baseline = cv2.getTextSize(text, font_face, font_scale, thickness)
+        pad = thickness
+        offset_x, offset_y = pad, text_h + pad  # Text origin inside the sprite
+        size = (text_h + baseline + 2 * pad, text_w + 2 * pad)
+        
+        sprite = np.zeros(size + (3,), dtype=np.uint8)
+        mask = np.zeros(size, dtype=np.uint8)
+        # LINE_8 (no anti-aliasing) keeps the mask binary, matching cv2.putText defaults
+        cv2.putText(sprite, text, (offset_x, offset_y), font_face, font_scale, color, thickness, cv2.LINE_8)
+        cv2.putText(mask, text, (offset_x, offset_y), font_face, font_scale, 255, thickness, cv2.LINE_8)
+        return sprite, (mask > 0)[:, :, None], offset_x, offset_y
+    
+    def draw_label(self, frame, text, org, font_face, font_scale, color, thickness):
+        """Draw a text label like cv2.putText, blitting a sprite cached per text and style (use for a fixed set of labels)"""
+        key = (text, font_face, font_scale, tuple(color), thickness)
+        label = self._label_sprites.get(key)
+        if label is None:
+            label = self._label_sprites[key] = self.render_label(text, font_face, font_scale, color, thickness)
+        
+        sprite, mask, offset_x, offset_y = label
+        x, y = org[0] - offset_x, org[1] - offset_y
+        h, w = sprite.shape[:2]
+        if x >= 0 and y >= 0 and x + w <= frame.shape[1] and y + h <= frame.shape[0]:
+            np.copyto(frame[y:y + h, x:x + w], sprite, where=mask)
+        else:
+            # Sprite would be clipped at the frame border
+            cv2.putText(frame, text, org, font_face, font_scale, color, thickness)
+    
     def draw_landmarks(self, frame, detection_result):
         """Draw landmarks and information on the frame"""
         if detection_result['eye_center']:
@@ -335,7 +452,7 @@ class MediaPipeEyeDetector:
             if detection_result['is_gazing']:
                 # Green circle indicates gaze state
                 cv2.circle(frame, (center_x, center_y), 30, (0, 255, 0), 3)
-                cv2.putText(frame, "GAZING", (center_x - 40, center_y - 40),
+                self.draw_label(frame, "GAZING", (center_x - 40, center_y - 40),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
             else:
                 # Red circle indicates not gazing
@@ -365,7 +482,7 @@ class MediaPipeEyeDetector:
                 status_color = (255, 255, 255)
                 status_text = state
             
-            cv2.putText(frame, f"Eyes: {status_text}", (10, frame.shape[0] - 120),
+            self.draw_label(frame, f"Eyes: {status_text}", (10, frame.shape[0] - 120),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, status_color, 2)
             
             # Display gaze state
@@ -374,25 +491,25 @@ class MediaPipeEyeDetector:
                 gaze_color = (0, 255, 0)
                 gaze_text = "GAZING"
                 # In gaze state, display video playing status
-                cv2.putText(frame, "VIDEO: PLAYING", (frame.shape[1] - 200, 30),
+                self.draw_label(frame, "VIDEO: PLAYING", (frame.shape[1] - 200, 30),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
                 # In gaze state, blinking does not pause video
                 if detection_result['is_blinking']:
-                    cv2.putText(frame, "BLINK (GAZING)", (frame.shape[1] - 200, 60),
+                    self.draw_label(frame, "BLINK (GAZING)", (frame.shape[1] - 200, 60),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 165, 255), 2)
             else:
                 gaze_color = (0, 0, 255)
                 gaze_text = "NOT GAZING"
                 # In non-gaze state, display video paused status
-                cv2.putText(frame, "VIDEO: PAUSED", (frame.shape[1] - 200, 30),
+                self.draw_label(frame, "VIDEO: PAUSED", (frame.shape[1] - 200, 30),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
                 # In non-gaze state, blinking causes video to pause
                 if detection_result['is_blinking']:
                     cv2.rectangle(frame, (frame.shape[1] - 200, 60), (frame.shape[1] - 10, 100), (0, 0, 255), -1)
-                    cv2.putText(frame, "BLINK (PAUSED)", (frame.shape[1] - 190, 90),
+                    self.draw_label(frame, "BLINK (PAUSED)", (frame.shape[1] - 190, 90),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
             
-            cv2.putText(frame, f"Gaze: {gaze_text}", (10, frame.shape[0] - 90),
+            self.draw_label(frame, f"Gaze: {gaze_text}", (10, frame.shape[0] - 90),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, gaze_color, 2)
             
             # Display gaze counter (for debugging)
@@ -315,6 +315,7 @@ class FullScreenPlayer(QWidget):
         """Exit full screen mode"""
         self.close()
         if self.parent_window:
+            self.parent_window.video_thread.set_preview_enabled(True)
             self.parent_window.showNormal()
             self.parent_window.show()
             
@@ -967,6 +967,10 @@ class MainWindow(QMainWindow):
         else:
             self.fullscreen_player.play_pause_btn.setText("Play")
             
+        # Camera preview is hidden in fullscreen mode, fullscreen overlays need the current status
+        self.video_thread.set_preview_enabled(False)
+        self.video_thread.resend_detection_status()
+        
         # Hide main window, show fullscreen player
         self.hide()
         self.fullscreen_player.show()
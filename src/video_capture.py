@@ -19,6 +19,11 @@ class VideoCaptureThread(QThread):
         self.running = False
         self.detecting = True
         self.show_landmarks = True
+        self.target_fps = 30  # Requested camera frame rate
+        self.preview_enabled = True  # Emit frame_ready for the camera preview
+        self._last_status_key = None  # Last emitted detection state, to skip duplicate emissions
+        self._last_status_time = 0.0  # When the detection status was last emitted
+        self.status_refresh_interval = 0.5  # Re-send an unchanged status this often (s), keeps auto-hiding overlays up
 
         # Add exit flag
         self.exiting = False
@@ -31,9 +36,9 @@ class VideoCaptureThread(QThread):
         # FPS calculation
         self.frame_count = 0
         self.fps = 0
-        self.last_fps_time = time.time()
+        self.last_fps_time = time.monotonic()
         self.last_command = None
-        self.last_face_detected_time = time.time()
+        self.last_face_detected_time = time.monotonic()
 
     def find_available_camera(self):
         """Automatically detect available camera"""
@@ -74,23 +79,25 @@ class VideoCaptureThread(QThread):
         with self._lock:
             self.cap = cv2.VideoCapture(camera_id)
             if self.cap.isOpened():
+                # Request MJPG so frames are decoded by libjpeg-turbo instead of converting raw YUYV
+                self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
                 self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
                 self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-                self.cap.set(cv2.CAP_PROP_FPS, 30)
+                self.cap.set(cv2.CAP_PROP_FPS, self.target_fps)
+                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Always read the newest frame
                 self._closed = False
 
         with self._lock:
             self.running = True
             self.frame_count = 0
             self.fps = 0
-            self.last_fps_time = time.time()
+            self.last_fps_time = time.monotonic()
         self.start()
 
     def stop_capture(self):
         #debug("Stopping camera capture...")
-        with self._lock:
-            self.running = False
-            self.exiting = True
+        self.running = False
+        self.exiting = True
 
         # Wait for thread to finish, but set timeout
         if self.isRunning():
@@ -124,66 +131,80 @@ class VideoCaptureThread(QThread):
                 self._closed = True
 
     def toggle_detection(self, detecting):
-        with self._lock:
-            self.detecting = detecting
+        self.detecting = detecting
 
     def toggle_landmarks(self, show):
-        with self._lock:
-            self.show_landmarks = show
+        self.show_landmarks = show
+
+    def set_preview_enabled(self, enabled):
+        """Enable or disable camera preview frames (frame_ready)"""
+        self.preview_enabled = enabled
+
+    def resend_detection_status(self):
+        """Force the next detection status to be emitted even if it has not changed"""
+        self._last_status_key = None
+
+    def _emit_detection_status(self, detection_result):
+        """Emit detection status when the reported state changes, and periodically while it doesn't"""
+        status_key = (
+            detection_result.get('face_detected'),
+            detection_result.get('eyes_closed'),
+            detection_result.get('eye_state'),
+            detection_result.get('gazing_state'),
+        )
+        now = time.monotonic()
+        if status_key != self._last_status_key or now - self._last_status_time >= self.status_refresh_interval:
+            self._last_status_key = status_key
+            self._last_status_time = now
+            self.detection_status.emit(detection_result)
 
     def run(self):
+        # cap.read() blocks at the camera's frame rate, pacing only kicks in if the driver runs faster
+        frame_period = 1.0 / self.target_fps
+        next_frame_time = time.monotonic()
+        
         while True:
-            # Check exit conditions
+            # Check exit conditions (flags are plain reads, the lock only guards cap lifecycle)
+            cap = self.cap
             should_continue = False
-            with self._lock:
-                if (self.running and self.cap is not None and not self._closed):
-                    try:
-                        should_continue = self.cap.isOpened()
-                    except:
-                        should_continue = False
+            if self.running and cap is not None and not self._closed:
+                try:
+                    should_continue = cap.isOpened()
+                except:
+                    should_continue = False
                     
             if not should_continue:
                 break
                 
             try:
                 ret, frame = None, None
-                cap_valid = False
-                with self._lock:
-                    cap_valid = self.cap is not None and not self._closed
+                try:
+                    ret, frame = cap.read()
+                except Exception as e:
+                    error(f"Error reading frame: {e}")
+                    ret = False
                     
-                if cap_valid:
-                    try:
-                        ret, frame = self.cap.read()
-                    except Exception as e:
-                        error(f"Error reading frame: {e}")
-                        ret = False
-                        
                 if ret and frame is not None:
                     # Calculate FPS
-                    with self._lock:
-                        self.frame_count += 1
-                        current_time = time.time()
-                        if current_time - self.last_fps_time >= 1.0:  # Update once per second
-                            self.fps = self.frame_count / (current_time - self.last_fps_time)
-                            self.frame_count = 0
-                            self.last_fps_time = current_time
-                    self.fps_updated.emit(self.fps)
-
-                    processed_frame = frame.copy()
+                    self.frame_count += 1
+                    current_time = time.monotonic()
+                    if current_time - self.last_fps_time >= 1.0:  # Update once per second
+                        self.fps = self.frame_count / (current_time - self.last_fps_time)
+                        self.frame_count = 0
+                        self.last_fps_time = current_time
+                        self.eye_detector.fps = self.fps
+                        self.fps_updated.emit(self.fps)
+
                     detection_result = {}
 
                     # Process frame if detection is enabled
-                    detecting_enabled = False
-                    with self._lock:
-                        detecting_enabled = self.detecting
-                        
-                    if detecting_enabled:
+                    if self.detecting:
                         try:
                             # Detect eye state
-                            detection_result = self.eye_detector.detect_eyes_state(processed_frame)
+                            detection_result = self.eye_detector.detect_eyes_state(frame)
 
                             # Emit detection status
-                            self.detection_status.emit(detection_result)
+                            self._emit_detection_status(detection_result)
 
                             # When playing video, continue playing if eyes are gazing at screen, 
                             command = None
@@ -191,8 +212,7 @@ class VideoCaptureThread(QThread):
 
                             if face_detected:
                                 # Update last face detected time
-                                with self._lock:
-                                    self.last_face_detected_time = current_time
+                                self.last_face_detected_time = current_time
 
                                 # Check if eyes are closed
                                 eyes_closed = detection_result.get('eyes_closed', False)
@@ -207,39 +227,40 @@ class VideoCaptureThread(QThread):
                                     command = "play"
                             else:
                                 # Pause video if no face detected for over 1 second
-                                last_face_time = 0
-                                with self._lock:
-                                    last_face_time = self.last_face_detected_time
-                                if current_time - last_face_time > 1.0:
+                                if current_time - self.last_face_detected_time > 1.0:
                                     command = "pause"
 
                             # Draw landmarks (optional)
-                            show_landmarks = False
-                            with self._lock:
-                                show_landmarks = self.show_landmarks
-                                
-                            if show_landmarks and face_detected:
-                                self.eye_detector.draw_landmarks(processed_frame, detection_result)
+                            if self.show_landmarks and self.preview_enabled and face_detected:
+                                # cap.read() returns a fresh buffer and detection keeps no reference to it,
+                                # so overlays are drawn in place without copying the frame
+                                self.eye_detector.draw_landmarks(frame, detection_result)
 
                             # Emit command signal
                             if command and command != self.last_command:
                                 #debug(f"Command detected: {command}")
                                 self.command_detected.emit(command)
-                                with self._lock:
-                                    self.last_command = command
+                                self.last_command = command
 
                         except Exception as e:
                             error(f"Detection error: {e}")
                             # Emit empty status to indicate detection failure
-                            self.detection_status.emit({})
+                            self._emit_detection_status({})
                     else:
                         # If detection is disabled, emit empty status
-                        self.detection_status.emit({})
+                        self._emit_detection_status({})
 
                     # Emit frame ready signal
-                    self.frame_ready.emit(processed_frame)
-
-                    time.sleep(0.03)  # ~30 FPS
+                    if self.preview_enabled:
+                        self.frame_ready.emit(frame)
+
+                    next_frame_time += frame_period
+                    delay = next_frame_time - time.monotonic()
+                    if delay > 0.001:
+                        time.sleep(delay)
+                    elif delay < 0:
+                        # Behind schedule (camera or detection is the bottleneck), don't try to catch up
+                        next_frame_time = time.monotonic()
                 else:
                     # If we can't read a frame, stop the capture
                     error("Cannot read frame from camera, stopping capture")
@@ -1,12 +1,20 @@
 import time
 import os
+import re
 import threading
 import subprocess
 import signal
+from collections import deque
 import av
-from PySide6.QtCore import QThread, Signal
+from av.codec.hwaccel import HWAccel, hwdevices_available
+from av.video.reformatter import VideoReformatter
+import numpy as np
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from log import debug, error
 
+# Volume percentage in pactl output
+_VOL_RE = re.compile(rb'(\d+)%')
+
 class VideoPlayerThread(QThread):
     """Stable video player thread using PyAV with proper synchronization"""
     frame_ready = Signal(object)
@@ -17,18 +25,24 @@ class VideoPlayerThread(QThread):
         super().__init__()
         self.container = None
         self.video_stream = None
+        self._has_audio = False
+        self._time_base_float = 0.0
+        self._inv_time_base = 0.0
         self.current_file = ""
         self.playing = False
         self.paused = False
         self.stopped = True
         self.video_fps = 30
+        self._frame_period = 1.0 / 30
         self.total_frames = 0
         self.video_width = 0
         self.video_height = 0
         self.video_duration = 0
+        self._inv_duration = 0.0
         self.exiting = False
         self.current_frame = 0
         self._lock = threading.RLock()
+        self._state_changed = threading.Condition(self._lock)  # Notified when run() should wake up
         
         # Time management
         self.play_start_time = 0  # When playback started
@@ -38,21 +52,61 @@ class VideoPlayerThread(QThread):
         
         # Frame decoding
         self.codec_context = None
+        self.hwaccel_device_types = ('vaapi', 'videotoolbox', 'd3d11va')  # Tried in order, CPU decoding otherwise
+        
+        # Decoded frame queue: filled ahead by run(), drained on the GUI thread by the presentation timer
+        self.frame_queue_size = 4
+        self._frame_queue = deque(maxlen=self.frame_queue_size)  # (frame, frame_time) pairs
+        self._frame_queue_lock = threading.Lock()
+        self._frame_queue_space = threading.Event()  # Set while the queue has room
+        self._frame_queue_space.set()
+        self._end_of_stream = False
+        
+        # Reusable BGR frame buffers, enough that a slot is never rewritten while queued or displayed
+        self._frame_pool = []
+        self._frame_pool_index = 0
+        self._reformatter = None  # Persistent swscale context for the BGR conversion
+        
+        # Presentation timer (lives on the GUI thread that created this object)
+        self._present_timer = QTimer(self)
+        self._present_timer.setTimerType(Qt.PreciseTimer)
+        self._present_timer.setSingleShot(True)
+        self.present_poll_interval = 5  # ms, re-check interval while the queue is empty
+        self._present_timer.timeout.connect(self._present_frame)
         
         # Audio player process
         self.audio_process = None
         self.audio_process_start_time = 0
         self._pause_position = 0
         
+        # System volume cache, avoids forking pactl on every query
+        self.volume_cache_interval = 0.5  # seconds
+        self._cached_volume = 100
+        self._cached_volume_time = None
+        
         # Seeking
         self.seek_requested = False
         self.seek_target = 0  # Target frame number
         self.seek_timestamp = 0  # Target timestamp in seconds
+        self.seek_decode_window = 2.0  # Forward seeks closer than this (seconds, ~1 GOP) decode on instead of re-seeking
         
         # For debugging
         self.last_frame_time = 0
         self.frame_count = 0
 
+    def _open_container(self, file_path):
+        """Open a video file with hardware decoding if a supported device is available"""
+        available = hwdevices_available()
+        for device_type in self.hwaccel_device_types:
+            if device_type not in available:
+                continue
+            try:
+                # Falls back to software decoding if the codec has no hardware path on this device
+                return av.open(file_path, hwaccel=HWAccel(device_type=device_type, allow_software_fallback=True))
+            except Exception as e:
+                error(f"Hardware decoding with {device_type} unavailable: {e}")
+        return av.open(file_path)
+    
     def load_video(self, file_path):
         """Load video file using PyAV"""
         try:
@@ -61,17 +115,20 @@ class VideoPlayerThread(QThread):
                 self._cleanup_resources()
                 
                 # Open video file
-                self.container = av.open(file_path)
+                self.container = self._open_container(file_path)
                 if not self.container:
                     error(f"Failed to open video file: {file_path}")
                     return False
                 
-                # Find video stream
+                # Find video stream and check for audio in a single pass
                 self.video_stream = None
+                self._has_audio = False
                 for stream in self.container.streams:
                     if stream.type == 'video':
-                        self.video_stream = stream
-                        break
+                        if not self.video_stream:
+                            self.video_stream = stream
+                    elif stream.type == 'audio':
+                        self._has_audio = True
                 
                 if not self.video_stream:
                     error(f"No video stream found in {file_path}")
@@ -81,17 +138,23 @@ class VideoPlayerThread(QThread):
                 
                 # Get video properties
                 self.video_fps = float(self.video_stream.average_rate) if self.video_stream.average_rate else 30
+                self._frame_period = 1.0 / self.video_fps if self.video_fps > 0 else 0.033
+                
+                # Stream time base as plain floats for per-frame timestamp math
+                self._time_base_float = float(self.video_stream.time_base)
+                self._inv_time_base = 1.0 / self._time_base_float
                 
                 # Get duration
                 if self.video_stream.duration:
-                    time_base = float(self.video_stream.time_base)
-                    self.video_duration = self.video_stream.duration * time_base
+                    self.video_duration = self.video_stream.duration * self._time_base_float
                 elif self.container.duration:
                     self.video_duration = self.container.duration / av.time_base
                 else:
                     # Estimate from frames if available
                     self.video_duration = 0
                 
+                self._inv_duration = 1.0 / self.video_duration if self.video_duration > 0 else 0.0
+                
                 # Estimate total frames
                 if self.video_fps > 0 and self.video_duration > 0:
                     self.total_frames = int(self.video_duration * self.video_fps)
@@ -105,6 +168,13 @@ class VideoPlayerThread(QThread):
                 # Get codec context
                 self.codec_context = self.video_stream.codec_context
                 
+                # Decode with slice threads before any packet is demuxed (FRAME threading adds
+                # one frame of latency per thread, which hurts the seek path)
+                self.codec_context.thread_type = av.codec.context.ThreadType.SLICE
+                self.codec_context.thread_count = max(2, (os.cpu_count() or 2) // 2)
+                # Emit each frame as soon as it can be output instead of buffering ahead of the decoder
+                self.codec_context.flags |= av.codec.context.Flags.low_delay
+                
                 # Reset state
                 self.playing = False
                 self.paused = False
@@ -117,6 +187,13 @@ class VideoPlayerThread(QThread):
                 self.base_timestamp = 0
                 self.frame_count = 0
                 self.last_frame_time = 0
+                self._clear_frame_queue()
+                self._frame_pool = [
+                    np.empty((self.video_height, self.video_width, 3), dtype=np.uint8)
+                    for _ in range(self.frame_queue_size + 2)
+                ]
+                self._frame_pool_index = 0
+                self._reformatter = VideoReformatter()
                 
                 #debug(f"Loaded video: {os.path.basename(file_path)}, "
                     #   f"{self.video_width}x{self.video_height}, "
@@ -162,21 +239,32 @@ class VideoPlayerThread(QThread):
             error(f"Error in cleanup: {e}")
     
     def _stop_audio_process(self):
-        """Safely stop audio process"""
+        """Safely stop audio process, reaping it in the background so callers never block"""
         if self.audio_process:
             try:
                 if self.audio_process.poll() is None:
-                    os.killpg(os.getpgid(self.audio_process.pid), signal.SIGTERM)
-                    try:
-                        self.audio_process.wait(timeout=2)  # Increase timeout period
-                    except subprocess.TimeoutExpired:
-                        os.killpg(os.getpgid(self.audio_process.pid), signal.SIGKILL)
-                    #debug("Audio process terminated")
+                    pgid = os.getpgid(self.audio_process.pid)
+                    os.killpg(pgid, signal.SIGTERM)
+                    threading.Thread(target=self._reap_audio_process,
+                                     args=(self.audio_process, pgid),
+                                     daemon=True).start()
             except Exception as e:
                 error(f"Error stopping audio process: {e}")
             finally:
                 self.audio_process = None
     
+    def _reap_audio_process(self, process, pgid):
+        """Wait for a terminated audio process to exit, killing it if it doesn't"""
+        try:
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                os.killpg(pgid, signal.SIGKILL)
+                process.wait()
+            #debug("Audio process terminated")
+        except Exception as e:
+            error(f"Error reaping audio process: {e}")
+    
     def _check_audio_device_status(self):
         """Check if audio devices are available"""
         try:
@@ -195,21 +283,27 @@ class VideoPlayerThread(QThread):
                 return False
     
     def _get_current_volume(self):
-        """Get current system volume percentage"""
+        """Get current system volume percentage (cached briefly)"""
+        now = time.monotonic()
+        if self._cached_volume_time is not None and now - self._cached_volume_time < self.volume_cache_interval:
+            return self._cached_volume
+        
+        volume = 100
         try:
             result = subprocess.run(['pactl', 'get-sink-volume', '@DEFAULT_SINK@'], 
                                     stdout=subprocess.PIPE, 
                                     stderr=subprocess.DEVNULL, 
-                                    text=True, 
                                     timeout=1)
             if result.returncode == 0:
-                import re
-                match = re.search(r'(\d+)%', result.stdout)
+                match = _VOL_RE.search(result.stdout)
                 if match:
-                    return int(match.group(1))
+                    volume = int(match.group(1))
         except Exception as e:
             error(f"Failed to get current volume: {e}")
-        return 100
+        
+        self._cached_volume = volume
+        self._cached_volume_time = now
+        return volume
     
     def _start_audio(self, start_time=0):
         """Start audio playback"""
@@ -239,87 +333,96 @@ class VideoPlayerThread(QThread):
                 cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid
+                start_new_session=True
             )
             
-            self.audio_process_start_time = time.time()
+            self.audio_process_start_time = time.monotonic()
             #debug(f"Started audio playback at {start_time:.2f}s")
             
         except Exception as e:
             error(f"Failed to start audio: {e}")
     
-    def _get_frame_at_time(self, target_time):
-        """Get frame at specific time with error handling"""
+    def _seek_video(self, target_time):
+        """Seek to the keyframe at or before target_time (seconds) on the video stream"""
+        pts = int(target_time * self._inv_time_base)
+        self.container.seek(pts, backward=True, any_frame=False, stream=self.video_stream)
+    
+    def _frame_to_bgr(self, frame):
+        """Convert a decoded frame to a contiguous BGR array in the next frame pool slot"""
+        if frame.width != self.video_width or frame.height != self.video_height or not self._frame_pool or not self._reformatter:
+            return frame.to_ndarray(format='bgr24')
+        
+        bgr_frame = self._frame_pool[self._frame_pool_index]
+        self._frame_pool_index = (self._frame_pool_index + 1) % len(self._frame_pool)
+        
+        # Copy the reformatted plane, dropping any line padding
+        plane = self._reformatter.reformat(frame, format='bgr24').planes[0]
+        rows = np.frombuffer(plane, dtype=np.uint8).reshape(-1, plane.line_size)
+        np.copyto(bgr_frame.reshape(frame.height, -1), rows[:frame.height, :frame.width * 3])
+        return bgr_frame
+    
+    def _restart_frame_sequence(self, target_time):
+        """Flush the decoder, seek to the keyframe before target_time and start a new frame sequence"""
         if not self.container or not self.video_stream:
             return None
-            
+        
         try:
-            # Seek to the target time
-            self.container.seek(int(target_time * 1000000))
-            
-            # Decode frames until we reach target time
-            for packet in self.container.demux(video=0):
-                for frame in packet.decode():
-                    if frame.pts is not None:
-                        frame_time = frame.pts * self.video_stream.time_base
-                        if float(frame_time) >= target_time:
-                            # Convert to numpy array
-                            rgb_frame = frame.to_ndarray(format='rgb24')
-                            # Convert RGB to BGR for OpenCV
-                            bgr_frame = rgb_frame[:, :, ::-1]
-                            return bgr_frame
-            
+            # Drop reference frames held from the old position
+            self.codec_context.flush_buffers()
+            self._seek_video(target_time)
+            return self._get_next_frame_sequence()
         except Exception as e:
-            error(f"Error getting frame at time {target_time}: {e}")
-            
-        return None
+            error(f"Error seeking to time {target_time}: {e}")
+            return None
     
     def _get_next_frame_sequence(self):
-        """Get the next frame in sequence (generator)"""
+        """Get the next decoded frame in sequence (generator), conversion to BGR is left to the caller"""
         if not self.container or not self.video_stream:
             return
             
         try:
-            for packet in self.container.demux(video=0):
-                if packet.stream.type != 'video':
-                    continue
-                    
+            time_base = self._time_base_float
+            for packet in self.container.demux(self.video_stream):
                 for frame in packet.decode():
-                    if frame.pts is not None:
-                        # Convert to numpy array
-                        rgb_frame = frame.to_ndarray(format='rgb24')
-                        # Convert RGB to BGR for OpenCV
-                        bgr_frame = rgb_frame[:, :, ::-1]
-                        
-                        # Calculate frame time
-                        frame_time = frame.pts * self.video_stream.time_base
-                        
-                        yield bgr_frame, float(frame_time)
+                    pts = frame.pts
+                    if pts is not None:
+                        yield frame, pts * time_base
                         
         except Exception as e:
             error(f"Error in frame sequence: {e}")
     
+    def _advance_to_time(self, frame_generator, target_time):
+        """Decode forward on an existing frame generator until target time is reached"""
+        try:
+            for frame, frame_time in frame_generator:
+                if frame_time >= target_time:
+                    return self._frame_to_bgr(frame)
+        except Exception as e:
+            error(f"Error advancing to time {target_time}: {e}")
+            
+        return None
+    
     def play(self):
         """Start playback"""
         with self._lock:
             if self.stopped:
                 # Starting from beginning or paused position
-                self.play_start_time = time.time() - self._pause_position
+                self.play_start_time = time.monotonic() - self._pause_position
                 self.base_timestamp = self._pause_position
             elif self.paused:
                 # Resuming from pause
-                self.accumulated_pause_time += (time.time() - self.last_pause_start)
-                self.play_start_time = time.time() - self.base_timestamp - self.accumulated_pause_time
+                self.accumulated_pause_time += (time.monotonic() - self.last_pause_start)
+                self.play_start_time = time.monotonic() - self.base_timestamp - self.accumulated_pause_time
             
             self.playing = True
             self.paused = False
             self.stopped = False
+            self._present_timer.start(0)
+            self._state_changed.notify_all()
             
             # Start audio if available
-            if self.container:
-                has_audio = any(stream.type == 'audio' for stream in self.container.streams)
-                if has_audio:
-                    self._start_audio(self.base_timestamp)
+            if self.container and self._has_audio:
+                self._start_audio(self.base_timestamp)
             
             #debug(f"Play started at position: {self.base_timestamp:.2f}s")
     
@@ -328,7 +431,7 @@ class VideoPlayerThread(QThread):
         with self._lock:
             if self.playing and not self.stopped:
                 # Calculate current position
-                current_time = time.time()
+                current_time = time.monotonic()
                 elapsed = current_time - self.play_start_time - self.accumulated_pause_time
                 self.base_timestamp = max(0, min(elapsed, self.video_duration))
                 
@@ -341,6 +444,7 @@ class VideoPlayerThread(QThread):
             
             self.paused = True
             self.playing = False
+            self._present_timer.stop()
             #debug(f"Playback paused at position: {self.base_timestamp:.2f}s")
     
     def stop(self):
@@ -356,22 +460,24 @@ class VideoPlayerThread(QThread):
             self.last_pause_start = 0
             self.base_timestamp = 0
             self.frame_count = 0
+            self._present_timer.stop()
+            self._clear_frame_queue()
+            
+            # Have the decoder restart from the beginning on the next play()
+            self.seek_timestamp = 0
+            self.seek_requested = True
             
             self._stop_audio_process()
             #debug("Playback stopped")
     
     def get_position(self):
         """Get current playback position (0.0 to 1.0)"""
-        with self._lock:
-            if self.video_duration > 0:
-                if self.playing:
-                    current_time = time.time()
-                    elapsed = current_time - self.play_start_time - self.accumulated_pause_time
-                    position = min(elapsed / self.video_duration, 1.0)
-                    return position
-                else:
-                    return min(self.base_timestamp / self.video_duration, 1.0)
-        return 0.0
+        # Lock-free: plain attribute reads, a position one frame stale is fine for the progress bar
+        if self.playing:
+            position = (time.monotonic() - self.play_start_time - self.accumulated_pause_time) * self._inv_duration
+        else:
+            position = self.base_timestamp * self._inv_duration
+        return 0.0 if position < 0 else (1.0 if position > 1.0 else position)
     
     def seek(self, frame_number):
         """Seek to specific frame"""
@@ -380,7 +486,6 @@ class VideoPlayerThread(QThread):
                 return
                 
             frame_number = max(0, min(frame_number, self.total_frames - 1))
-            self.seek_requested = True
             self.seek_target = frame_number
             
             # Calculate timestamp for seek
@@ -389,13 +494,18 @@ class VideoPlayerThread(QThread):
             else:
                 self.seek_timestamp = 0
             
-            # Update current position
+            # Publish the request only once the timestamp is set, run() reads both without the lock
+            self.seek_requested = True
+            self._state_changed.notify_all()
+            
+            # Update current position and drop frames decoded before the seek
             self.base_timestamp = self.seek_timestamp
             self.current_frame = frame_number
+            self._clear_frame_queue()
             
             # Reset timing
             if self.playing:
-                self.play_start_time = time.time() - self.seek_timestamp
+                self.play_start_time = time.monotonic() - self.seek_timestamp
                 self.accumulated_pause_time = 0
                 
                 # Restart audio at new position
@@ -406,22 +516,97 @@ class VideoPlayerThread(QThread):
             
             #debug(f"Seek to frame {frame_number}, time: {self.seek_timestamp:.2f}s")
     
+    def _queue_frame(self, frame, frame_time):
+        """Add a decoded frame to the presentation queue"""
+        with self._frame_queue_lock:
+            # A seek request makes frames decoded for the old position stale
+            if self.seek_requested:
+                return
+            self._frame_queue.append((frame, frame_time))
+            if len(self._frame_queue) >= self.frame_queue_size:
+                self._frame_queue_space.clear()
+    
+    def _clear_frame_queue(self):
+        """Drop all queued frames and forget a previous end of stream"""
+        with self._frame_queue_lock:
+            self._frame_queue.clear()
+            self._frame_queue_space.set()
+            self._end_of_stream = False
+    
+    def _present_frame(self):
+        """Emit the newest queued frame that is due (runs on the GUI thread)"""
+        with self._lock:
+            if not self.playing or self.paused:
+                return
+            target_time = time.monotonic() - self.play_start_time - self.accumulated_pause_time
+        
+        frame = None
+        with self._frame_queue_lock:
+            # Frames that are already late are dropped in favour of the newest due frame
+            while self._frame_queue and self._frame_queue[0][1] <= target_time:
+                frame, frame_time = self._frame_queue.popleft()
+            if frame is not None:
+                self._frame_queue_space.set()
+            # The end of stream is stale while a seek is pending, the decoder hasn't restarted yet
+            finished = self._end_of_stream and not self._frame_queue and not self.seek_requested
+            next_frame_time = self._frame_queue[0][1] if self._frame_queue else None
+        
+        if frame is not None:
+            self.frame_ready.emit(frame)
+            self.frame_count += 1
+            
+            # Update current position
+            with self._lock:
+                self.current_frame = int(frame_time * self.video_fps)
+                self.base_timestamp = frame_time
+            
+            # Check if we've reached the end
+            if frame_time >= self.video_duration - self._frame_period:
+                finished = True
+        
+        if finished:
+            with self._lock:
+                self.playing = False
+                self.stopped = True
+                self._present_timer.stop()
+                self._stop_audio_process()
+            self.playback_finished.emit()
+            #debug("Playback finished")
+            return
+        
+        # Re-arm for the next queued frame's deadline instead of polling every few ms
+        with self._lock:
+            if not self.playing or self.paused:
+                return
+        if next_frame_time is None:
+            delay_ms = self.present_poll_interval
+        else:
+            delay_ms = max(1, int((next_frame_time - target_time) * 1000))
+        self._present_timer.start(delay_ms)
+    
+    def _is_active(self):
+        """Check whether run() should be decoding (or exiting) rather than idling"""
+        return self.exiting or (self.playing and not self.paused and not self.stopped)
+    
+    def _wait_for_state(self, predicate, timeout=0.5):
+        """Block run() until predicate holds after a state change notification, or timeout"""
+        with self._lock:
+            self._state_changed.wait_for(predicate, timeout)
+    
     def run(self):
-        """Main playback loop with precise timing"""
+        """Decode loop, keeps the frame queue filled ahead of the presentation timer"""
         frame_generator = None
-        current_frame_time = 0
+        current_frame_time = 0  # Time of the last decoded frame
+        
+        # Bound methods used for every frame
+        wait_for_space = self._frame_queue_space.wait
+        frame_to_bgr = self._frame_to_bgr
+        queue_frame = self._queue_frame
         
         while not self.exiting:
-            # Check state
-            with self._lock:
-                playing = self.playing
-                paused = self.paused
-                stopped = self.stopped
-                seek_requested = self.seek_requested
-                seek_timestamp = self.seek_timestamp
-                
-            if stopped or not playing or paused:
-                time.sleep(0.01)
+            # Check state (plain attribute reads, the GUI thread is the only writer)
+            if self.stopped or not self.playing or self.paused:
+                self._wait_for_state(self._is_active)
                 continue
                 
             if not self.container or not self.video_stream:
@@ -429,95 +614,74 @@ class VideoPlayerThread(QThread):
                 continue
             
             # Handle seeking
-            if seek_requested:
-                with self._lock:
-                    self.seek_requested = False
+            if self.seek_requested:
+                # Clear the flag before reading the timestamp so a newer seek is never lost
+                self.seek_requested = False
+                seek_timestamp = self.seek_timestamp
                 
-                # Reset generator
-                frame_generator = None
+                frame = None
+                seek_delta = seek_timestamp - current_frame_time
+                if frame_generator is not None and 0 <= seek_delta < self.seek_decode_window:
+                    # Close forward seek: keep decoding from the current position
+                    frame = self._advance_to_time(frame_generator, seek_timestamp)
+                
+                if frame is None:
+                    # Far seek: restart decoding from the keyframe before the target and keep the
+                    # resulting sequence for playback, so the GOP is only decoded once
+                    frame_generator = self._restart_frame_sequence(seek_timestamp)
+                    if frame_generator is not None:
+                        frame = self._advance_to_time(frame_generator, seek_timestamp)
                 
-                # Get frame at seek position
-                frame = self._get_frame_at_time(seek_timestamp)
+                # Show the seek frame right away
+                self._clear_frame_queue()
                 if frame is not None:
-                    self.frame_ready.emit(frame)
-                    self.frame_count += 1
+                    self._queue_frame(frame, seek_timestamp)
                 
                 # Calculate frame time for synchronization
-                with self._lock:
-                    current_frame_time = self.base_timestamp
-                    self.last_frame_time = time.time()
+                current_frame_time = seek_timestamp
+                self.last_frame_time = time.monotonic()
                 
                 # Continue to normal playback
                 continue
             
+            # Everything has been decoded, the presentation timer finishes playback
+            if self._end_of_stream:
+                self._wait_for_state(lambda: self.exiting or self.seek_requested or not self.playing)
+                continue
+            
             # Initialize frame generator if needed
             if frame_generator is None:
                 # Seek to current position and start generator
-                try:
-                    self.container.seek(int(current_frame_time * 1000000))
-                    frame_generator = self._get_next_frame_sequence()
-                except Exception as e:
-                    error(f"Error initializing frame generator: {e}")
+                frame_generator = self._restart_frame_sequence(current_frame_time)
+                if frame_generator is None:
                     time.sleep(0.01)
                     continue
             
-            # Calculate target time
-            current_time = time.time()
-            with self._lock:
-                target_time = current_time - self.play_start_time - self.accumulated_pause_time
-            
-            # Limit target time to video duration
-            target_time = max(0, min(target_time, self.video_duration))
+            # Wait for room in the frame queue
+            if not wait_for_space(timeout=0.05):
+                continue
             
-            # Check if we need a new frame
-            if target_time > current_frame_time + (1.0 / self.video_fps):
-                try:
-                    # Get next frame from generator
-                    frame, frame_time = next(frame_generator)
-                    
-                    if frame is not None:
-                        # Emit frame
-                        self.frame_ready.emit(frame)
-                        self.frame_count += 1
-                        
-                        # Update current position
-                        with self._lock:
-                            current_frame_time = frame_time
-                            self.current_frame = int(frame_time * self.video_fps)
-                            self.base_timestamp = frame_time
-                        
-                        # Check if we've reached the end
-                        if frame_time >= self.video_duration - (1.0 / self.video_fps):
-                            with self._lock:
-                                self.playing = False
-                                self.stopped = True
-                                self.playback_finished.emit()
-                                self._stop_audio_process()
-                            #debug("Playback finished")
-                            continue
+            try:
+                # Get next frame from generator
+                frame, frame_time = next(frame_generator)
                 
-                except StopIteration:
-                    # End of video
-                    with self._lock:
-                        self.playing = False
-                        self.stopped = True
-                        self.playback_finished.emit()
-                        self._stop_audio_process()
-                    #debug("Playback finished (end of stream)")
-                    continue
-                except Exception as e:
-                    error(f"Error getting frame: {e}")
-                    # Reset generator and try again
-                    frame_generator = None
-                    time.sleep(0.01)
-                    continue
+                # After (re)initializing the generator, skip frames between the keyframe and the position
+                if frame is not None and frame_time >= current_frame_time:
+                    current_frame_time = frame_time
+                    queue_frame(frame_to_bgr(frame), frame_time)
             
-            # Sleep to maintain frame rate
-            if self.video_fps > 0:
-                sleep_time = max(0.001, (1.0 / self.video_fps) - 0.005)  # Slightly faster than frame rate
-                time.sleep(sleep_time)
-            else:
-                time.sleep(0.033)
+            except StopIteration:
+                # End of video
+                with self._frame_queue_lock:
+                    self._end_of_stream = True
+                #debug("Decoding finished (end of stream)")
+                continue
+            except Exception as e:
+                error(f"Error getting frame: {e}")
+                # Reset generator and try again
+                frame_generator = None
+                time.sleep(0.01)
+                continue
         
         #debug("Video player thread exited")
     
@@ -529,6 +693,9 @@ class VideoPlayerThread(QThread):
             self.playing = False
             self.paused = False
             self.stopped = True
+            self._present_timer.stop()
+            self._frame_queue_space.set()  # Release a producer waiting for queue space
+            self._state_changed.notify_all()
             
             # Ensure thread is stopped before cleaning up
             self._stop_audio_process()